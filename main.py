@@ -248,6 +248,7 @@ def run_modular_cli(bootstrap):
     except KeyboardInterrupt:
         print("\nShutting down...")
         hotkey_handler.stop_listening()
+        container.resolve(ITextOutput).close()
 
 
 def run_modular_gui(bootstrap):
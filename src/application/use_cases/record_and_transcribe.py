@@ -119,7 +119,8 @@ class RecordAndTranscribeUseCase:
             # Validate transcription
             is_valid, error_msg = self.validator.validate_transcription(
                 transcription,
-                audio_data
+                audio_data,
+                audio_rms=transcription.audio_rms
             )
             
             if not is_valid:
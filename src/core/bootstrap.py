@@ -81,7 +81,11 @@ class ApplicationBootstrap:
         )
         
         # Register infrastructure - Transcription
-        self.container.register_singleton(ITranscriber, WhisperAdapter)
+        self.container.register_factory(
+            ITranscriber,
+            self._create_transcriber,
+            scope=Scope.SINGLETON
+        )
         self.container.register_singleton(ModelManager, ModelManager)
         
         # Register infrastructure - Windows
@@ -103,6 +107,24 @@ class ApplicationBootstrap:
         self.container.register_transient(SendTextUseCase, SendTextUseCase)
         self.container.register_transient(ManageRecordingUseCase, ManageRecordingUseCase)
     
+    def _create_transcriber(self) -> ITranscriber:
+        """Create the transcriber for the configured backend.
+        
+        Returns:
+            Transcriber instance
+        """
+        backend = self.config.transcription.backend
+        if backend == 'faster-whisper':
+            # Imported here so faster-whisper stays an optional dependency
+            from src.infrastructure.transcription.faster_whisper_adapter import FasterWhisperAdapter
+            return FasterWhisperAdapter()
+        if backend != 'whisper':
+            raise ValueError(f"Unknown transcription backend: {backend}")
+        return WhisperAdapter(
+            model_manager=self.container.resolve(ModelManager),
+            quantize_cpu=self.config.transcription.quantize_cpu
+        )
+    
     def get_container(self) -> Container:
         """Get the configured DI container.
         
@@ -22,6 +22,7 @@ class AudioConfig:
 @dataclass
 class TranscriptionConfig:
     """Transcription configuration settings."""
+    backend: str = 'whisper'  # 'whisper' or 'faster-whisper'
     model_size: str = 'base'
     language: str = 'en'
     device: Optional[str] = None  # None for auto-detect
@@ -29,6 +30,7 @@ class TranscriptionConfig:
     best_of: int = 5
     temperature: float = 0.0
     fp16: Optional[bool] = None  # None for auto-detect based on device
+    quantize_cpu: bool = False  # int8 dynamic quantization of the CPU model
 
 
 @dataclass
@@ -105,13 +107,15 @@ class Config:
                 'device_id': self.audio.device_id
             },
             'transcription': {
+                'backend': self.transcription.backend,
                 'model_size': self.transcription.model_size,
                 'language': self.transcription.language,
                 'device': self.transcription.device,
                 'beam_size': self.transcription.beam_size,
                 'best_of': self.transcription.best_of,
                 'temperature': self.transcription.temperature,
-                'fp16': self.transcription.fp16
+                'fp16': self.transcription.fp16,
+                'quantize_cpu': self.transcription.quantize_cpu
             },
             'hotkey': {
                 'record_key': self.hotkey.record_key,
@@ -16,6 +16,15 @@ class Transcription:
     confidence: Optional[float] = None
     audio_rms: Optional[float] = None
     
+    # Phrases Whisper commonly produces from silence or noise
+    HALLUCINATION_PHRASES = frozenset([
+        "thank you", "thanks", "thank you.", "thanks.",
+        "thank you for watching", "thanks for watching",
+        "please subscribe", "subscribe", "bye", "bye.",
+        "you", "you.", "♪", "[music]", "[applause]",
+        ".", "..", "...", ""
+    ])
+    
     @classmethod
     def create(
         cls,
@@ -42,18 +51,10 @@ class Transcription:
     
     def is_likely_hallucination(self) -> bool:
         """Check if the transcription is likely a Whisper hallucination."""
-        hallucinations = [
-            "thank you", "thanks", "thank you.", "thanks.", 
-            "thank you for watching", "thanks for watching",
-            "please subscribe", "subscribe", "bye", "bye.",
-            "you", "you.", "♪", "[music]", "[applause]",
-            ".", "..", "...", ""
-        ]
-        
         text_lower = self.text.lower().strip()
         
         # Check for exact matches
-        if text_lower in hallucinations:
+        if text_lower in self.HALLUCINATION_PHRASES:
             return True
         
         # Check for very short text with low RMS (likely silence)
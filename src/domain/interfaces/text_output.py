@@ -65,4 +65,8 @@ class ITextOutput(ABC):
         Returns:
             True if the window exists, False otherwise
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def close(self) -> None:
+        """Release any resources held by the text output."""
+        pass
@@ -0,0 +1,84 @@
+"""Vectorized frame-level kernels used by AudioProcessor."""
+
+from typing import Tuple
+import numpy as np
+
+
+def noise_gate_inplace(
+    data: np.ndarray,
+    window_size: int,
+    fade_length: int,
+    threshold: float
+) -> None:
+    """Gate every 'window_size' window whose RMS is below threshold, in place.
+
+    Gated windows fade out over 'fade_length' samples and are zeroed after.
+    Windows run along axis 0, so multi-channel buffers are gated on the
+    energy of all channels together. 'data' must be C-contiguous so the
+    framed reshape below is a view.
+    """
+    num_windows = len(range(0, len(data) - window_size, window_size))
+    if num_windows <= 0:
+        return
+
+    # Frame the signal into non-overlapping windows (a view, no copies)
+    frames = data[:num_windows * window_size].reshape(num_windows, window_size, -1)
+    energy = np.einsum('ijk,ijk->i', frames, frames)
+    window_rms = np.sqrt(energy / (window_size * frames.shape[2]))
+
+    # Apply gate (fade out) to every window below the threshold
+    gated = window_rms < threshold
+    fade = np.linspace(1.0, 0.0, fade_length, dtype=data.dtype)
+    frames[gated, :fade_length] *= fade[:, None]
+    frames[gated, fade_length:] = 0
+
+
+def trim_bounds(
+    data: np.ndarray,
+    window_size: int,
+    threshold: float
+) -> Tuple[int, int]:
+    """Find the (start, end) sample indices of non-silent audio.
+
+    Frames of 'window_size' samples step by half a window; (0, len(data))
+    is returned for whichever side has no frame above the threshold.
+    """
+    start_idx = 0
+    end_idx = len(data)
+
+    if len(data) <= window_size:
+        return start_idx, end_idx
+
+    # Frame along axis 0 so multi-channel frames cover every channel.
+    # Frame energies are compared against threshold**2 to skip the sqrt.
+    frames = np.lib.stride_tricks.sliding_window_view(data, window_size, axis=0)
+    frame_size = window_size * (data.size // len(data))
+    subscripts = 'ij,ij->i' if data.ndim == 1 else 'ijk,ijk->i'
+    threshold_sq = threshold ** 2
+
+    # Find start of non-silence (frames stepping forward from 0)
+    hop = window_size // 2
+    forward = frames[0:len(data) - window_size:hop]
+    loud = np.einsum(subscripts, forward, forward) / frame_size > threshold_sq
+    if loud.any():
+        start_idx = int(np.argmax(loud)) * hop
+
+    # Find end of non-silence (frames stepping back from the tail)
+    back_hop = -window_size // 2
+    backward = frames[len(data) - window_size:0:back_hop]
+    loud = np.einsum(subscripts, backward, backward) / frame_size > threshold_sq
+    if loud.any():
+        end_idx = len(data) + int(np.argmax(loud)) * back_hop
+
+    return start_idx, end_idx
+
+
+def summary_stats(data: np.ndarray) -> Tuple[float, float, float, float]:
+    """Return (sum, sum of squares, min, max) of a non-empty buffer."""
+    flat = data.ravel()
+    return (
+        float(flat.sum(dtype=np.float64)),
+        float(np.dot(flat, flat)),
+        float(flat.min()),
+        float(flat.max())
+    )
@@ -1,6 +1,10 @@
+import math
 import numpy as np
 from typing import Optional
 from src.domain.value_objects.audio_data import AudioData
+from src.domain.services._audio_kernels import (
+    noise_gate_inplace, summary_stats, trim_bounds
+)
 
 
 class AudioProcessor:
@@ -41,7 +45,8 @@ class AudioProcessor:
         audio_data: AudioData,
         threshold: float = 0.001,
         attack_time: float = 0.01,
-        release_time: float = 0.1
+        release_time: float = 0.1,
+        inplace: bool = False
     ) -> AudioData:
         """Apply a noise gate to remove low-level noise.
         
@@ -50,11 +55,19 @@ class AudioProcessor:
             threshold: Gate threshold (RMS level)
             attack_time: Time to open the gate (seconds)
             release_time: Time to close the gate (seconds)
+            inplace: Gate the input buffer directly instead of a copy. Only
+                use when the caller no longer needs the original audio.
             
         Returns:
             Processed AudioData
         """
-        data = audio_data.data.copy()
+        if inplace:
+            data = audio_data.data
+            # Stats cached on the input no longer describe its buffer
+            audio_data._cache.clear()
+        else:
+            data = np.empty_like(audio_data.data)
+            np.copyto(data, audio_data.data)
         sample_rate = audio_data.sample_rate
         
         # Calculate window sizes
@@ -62,17 +75,8 @@ class AudioProcessor:
         attack_samples = int(attack_time * sample_rate)
         release_samples = int(release_time * sample_rate)
         
-        # Process in windows
-        for i in range(0, len(data) - window_size, window_size):
-            window = data[i:i + window_size]
-            window_rms = np.sqrt(np.mean(window ** 2))
-            
-            if window_rms < threshold:
-                # Apply gate (fade out)
-                fade_length = min(release_samples, window_size)
-                fade = np.linspace(1.0, 0.0, fade_length)
-                data[i:i + fade_length] *= fade
-                data[i + fade_length:i + window_size] = 0
+        fade_length = min(release_samples, window_size)
+        noise_gate_inplace(data, window_size, fade_length, threshold)
         
         return AudioData(
             data=data,
@@ -100,21 +104,7 @@ class AudioProcessor:
         sample_rate = audio_data.sample_rate
         window_size = int(min_silence_duration * sample_rate)
         
-        # Find start of non-silence
-        start_idx = 0
-        for i in range(0, len(data) - window_size, window_size // 2):
-            window = data[i:i + window_size]
-            if np.sqrt(np.mean(window ** 2)) > threshold:
-                start_idx = i
-                break
-        
-        # Find end of non-silence
-        end_idx = len(data)
-        for i in range(len(data) - window_size, 0, -window_size // 2):
-            window = data[i:i + window_size]
-            if np.sqrt(np.mean(window ** 2)) > threshold:
-                end_idx = i + window_size
-                break
+        start_idx, end_idx = trim_bounds(data, window_size, threshold)
         
         # Ensure we don't trim everything
         if start_idx >= end_idx:
@@ -144,25 +134,38 @@ class AudioProcessor:
             'sample_rate': audio_data.sample_rate,
             'channels': audio_data.channels,
             'num_samples': audio_data.num_samples,
-            'rms': audio_data.calculate_rms(),
-            'peak_amplitude': audio_data.calculate_peak_amplitude(),
-            'is_silent': audio_data.is_silent(),
         }
         
+        if len(data) == 0:
+            features['rms'] = audio_data.calculate_rms()
+            features['peak_amplitude'] = audio_data.calculate_peak_amplitude()
+            features['is_silent'] = audio_data.is_silent()
+            return features
+        
+        # Single pass for sum, sum of squares, min and max; RMS, peak and
+        # silence all derive from it, and seed the AudioData's own cache
+        total, total_sq, min_val, max_val = summary_stats(data)
+        audio_data._cache.setdefault('sum_sq', total_sq)
+        audio_data._cache.setdefault('peak', max(max_val, -min_val))
+        mean = total / data.size
+        
+        features['rms'] = audio_data.calculate_rms()
+        features['peak_amplitude'] = audio_data.calculate_peak_amplitude()
+        features['is_silent'] = audio_data.is_silent()
+        
         # Additional features
-        if len(data) > 0:
-            features['mean'] = float(np.mean(data))
-            features['std'] = float(np.std(data))
-            features['min'] = float(np.min(data))
-            features['max'] = float(np.max(data))
-            
-            # Zero crossing rate
-            zero_crossings = np.sum(np.diff(np.sign(data)) != 0)
-            features['zero_crossing_rate'] = zero_crossings / len(data)
-            
-            # Dynamic range
-            features['dynamic_range_db'] = 20 * np.log10(
-                features['peak_amplitude'] / (features['rms'] + 1e-10)
-            )
+        features['mean'] = mean
+        features['std'] = math.sqrt(max(total_sq / data.size - mean * mean, 0.0))
+        features['min'] = min_val
+        features['max'] = max_val
+        
+        # Zero crossing rate
+        zero_crossings = int(np.count_nonzero(data[1:] * data[:-1] < 0))
+        features['zero_crossing_rate'] = zero_crossings / len(data)
+        
+        # Dynamic range
+        features['dynamic_range_db'] = 20 * np.log10(
+            features['peak_amplitude'] / (features['rms'] + 1e-10)
+        )
         
         return features
\ No newline at end of file
@@ -60,13 +60,16 @@ class TranscriptionValidator:
     def validate_transcription(
         self,
         transcription: Transcription,
-        audio_data: Optional[AudioData] = None
+        audio_data: Optional[AudioData] = None,
+        audio_rms: Optional[float] = None
     ) -> tuple[bool, Optional[str]]:
         """Validate a transcription result.
         
         Args:
             transcription: The transcription to validate
             audio_data: Optional audio data for additional validation
+            audio_rms: Optional precomputed RMS of the audio, used instead of
+                recalculating it from audio_data
             
         Returns:
             Tuple of (is_valid, error_message)
@@ -84,10 +87,10 @@ class TranscriptionValidator:
             return False, f"Likely hallucination: '{transcription.text}'"
         
         # Additional validation with audio data
-        if audio_data:
+        if audio_data or audio_rms is not None:
             # Short text with low RMS is likely a hallucination
             if len(transcription.text) <= 15:
-                rms = audio_data.calculate_rms()
+                rms = audio_rms if audio_rms is not None else audio_data.calculate_rms()
                 if rms < self.min_rms_for_short_text:
                     return False, f"Short text with low audio energy (possible hallucination)"
         
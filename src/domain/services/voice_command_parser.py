@@ -1,8 +1,25 @@
+import re
 from typing import List, Optional
 from src.domain.entities.voice_command import VoiceCommand, CommandType
 from src.domain.value_objects.transcription_text import TranscriptionText
 
 
+def _compile_commands(**patterns: List[str]) -> re.Pattern:
+    """Compile all command prefixes into one case-insensitive regex.
+    
+    Each keyword argument becomes a named group, tried in argument order so
+    earlier command types take priority. Within a group prefixes are tried
+    longest first so 'execute mode' wins over 'execute', and the trailing
+    word boundary stops 'config' matching 'configure'.
+    """
+    groups = []
+    for name, prefixes in patterns.items():
+        ordered = sorted(prefixes, key=len, reverse=True)
+        alternation = '|'.join(re.escape(p) for p in ordered)
+        groups.append(f'(?P<{name}>{alternation})')
+    return re.compile(r'(?:' + '|'.join(groups) + r')\b', re.IGNORECASE)
+
+
 class VoiceCommandParser:
     """Domain service for parsing voice commands from transcribed text."""
     
@@ -31,6 +48,18 @@ class VoiceCommandParser:
         'setup'
     ]
     
+    _COMMAND_RE = _compile_commands(
+        execute=EXECUTE_PATTERNS,
+        window=WINDOW_PATTERNS,
+        config=CONFIG_PATTERNS
+    )
+    
+    _COMMAND_TYPES = {
+        'execute': CommandType.EXECUTE,
+        'window': CommandType.WINDOW_TARGET,
+        'config': CommandType.CONFIG
+    }
+    
     def parse(self, text: str) -> VoiceCommand:
         """Parse a voice command from transcribed text.
         
@@ -45,40 +74,36 @@ class VoiceCommandParser:
         
         transcription = TranscriptionText.create(text)
         
-        # Check for execute commands
-        has_execute, execute_prefix = transcription.contains_command_prefix(self.EXECUTE_PATTERNS)
-        if has_execute:
-            cleaned_text = transcription.remove_prefix(execute_prefix)
+        # One regex scan finds the command prefix, if any
+        match = self._COMMAND_RE.match(transcription.cleaned_text)
+        if not match:
+            # Default to regular text command
+            return VoiceCommand.create_text(transcription.cleaned_text)
+        
+        cleaned_text = transcription.remove_prefix_length(match.end()).cleaned_text
+        command_type = match.lastgroup
+        
+        if command_type == 'execute':
             return VoiceCommand.create_execute(
-                text=cleaned_text.cleaned_text,
+                text=cleaned_text,
                 original_text=text
             )
         
-        # Check for window targeting commands
-        has_window, window_prefix = transcription.contains_command_prefix(self.WINDOW_PATTERNS)
-        if has_window:
-            cleaned_text = transcription.remove_prefix(window_prefix)
+        if command_type == 'window':
             return VoiceCommand(
                 command_type=CommandType.WINDOW_TARGET,
-                text=cleaned_text.cleaned_text,
+                text=cleaned_text,
                 original_text=text,
                 execute=False,
-                target_window=cleaned_text.cleaned_text
+                target_window=cleaned_text
             )
         
-        # Check for configuration commands
-        has_config, config_prefix = transcription.contains_command_prefix(self.CONFIG_PATTERNS)
-        if has_config:
-            cleaned_text = transcription.remove_prefix(config_prefix)
-            return VoiceCommand(
-                command_type=CommandType.CONFIG,
-                text=cleaned_text.cleaned_text,
-                original_text=text,
-                execute=False
-            )
-        
-        # Default to regular text command
-        return VoiceCommand.create_text(transcription.cleaned_text)
+        return VoiceCommand(
+            command_type=CommandType.CONFIG,
+            text=cleaned_text,
+            original_text=text,
+            execute=False
+        )
     
     def parse_multiple(self, texts: List[str]) -> List[VoiceCommand]:
         """Parse multiple voice commands.
@@ -100,16 +125,10 @@ class VoiceCommandParser:
         Returns:
             The detected CommandType
         """
-        transcription = TranscriptionText.create(text)
-        
-        if transcription.contains_command_prefix(self.EXECUTE_PATTERNS)[0]:
-            return CommandType.EXECUTE
-        elif transcription.contains_command_prefix(self.WINDOW_PATTERNS)[0]:
-            return CommandType.WINDOW_TARGET
-        elif transcription.contains_command_prefix(self.CONFIG_PATTERNS)[0]:
-            return CommandType.CONFIG
-        else:
+        match = self._COMMAND_RE.match(TranscriptionText.create(text).cleaned_text)
+        if not match:
             return CommandType.TEXT
+        return self._COMMAND_TYPES[match.lastgroup]
     
     def is_execute_command(self, text: str) -> bool:
         """Quick check if text is an execute command.
@@ -1,15 +1,21 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import math
 from typing import Optional
 import numpy as np
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class AudioData:
-    """Value object representing audio data."""
+    """Value object representing audio data.
+    
+    RMS, peak and energy are cached on first use, so the sample buffer must
+    not be modified in place after any of them has been read.
+    """
     
     data: np.ndarray
     sample_rate: int
     channels: int
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate audio data after initialization."""
@@ -21,6 +27,11 @@ class AudioData:
         
         if len(self.data.shape) > 2:
             raise ValueError(f"Audio data must be 1D or 2D, got shape {self.data.shape}")
+        
+        # Store samples as contiguous float32 to halve memory traffic on every
+        # reduction and let ravel() and BLAS work on the buffer without copies
+        if self.data.dtype != np.float32 or not self.data.flags.c_contiguous:
+            object.__setattr__(self, 'data', np.ascontiguousarray(self.data, dtype=np.float32))
     
     @property
     def duration_seconds(self) -> float:
@@ -32,21 +43,34 @@ class AudioData:
         """Get the number of audio samples."""
         return len(self.data)
     
+    def _sum_of_squares(self) -> float:
+        """Get the (cached) sum of squared samples."""
+        if 'sum_sq' not in self._cache:
+            flat = self.data.ravel()
+            self._cache['sum_sq'] = float(np.dot(flat, flat))
+        return self._cache['sum_sq']
+    
     def calculate_rms(self) -> float:
         """Calculate the RMS (Root Mean Square) energy of the audio."""
         if len(self.data) == 0:
             return 0.0
-        return float(np.sqrt(np.mean(self.data ** 2)))
+        return math.sqrt(self._sum_of_squares() / self.data.size)
     
     def calculate_peak_amplitude(self) -> float:
         """Calculate the peak amplitude of the audio."""
-        if len(self.data) == 0:
-            return 0.0
-        return float(np.max(np.abs(self.data)))
+        if 'peak' not in self._cache:
+            if len(self.data) == 0:
+                self._cache['peak'] = 0.0
+            else:
+                self._cache['peak'] = float(max(self.data.max(), -self.data.min()))
+        return self._cache['peak']
     
     def is_silent(self, threshold: float = 0.001) -> bool:
         """Check if the audio is silent based on RMS threshold."""
-        return self.calculate_rms() < threshold
+        if len(self.data) == 0:
+            return 0.0 < threshold
+        # Compare mean square against threshold**2 to skip the sqrt
+        return self._sum_of_squares() < threshold * threshold * self.data.size
     
     def is_too_short(self, min_duration: float = 0.5) -> bool:
         """Check if the audio is too short."""
@@ -59,21 +83,40 @@ class AudioData:
     def normalize(self, target_peak: float = 0.9) -> 'AudioData':
         """Return a normalized version of the audio data."""
         peak = self.calculate_peak_amplitude()
-        if peak > 0:
-            normalized_data = self.data / peak * target_peak
-        else:
-            normalized_data = self.data
+        if peak <= 0:
+            return AudioData(
+                data=self.data,
+                sample_rate=self.sample_rate,
+                channels=self.channels
+            )
         
-        return AudioData(
+        # One float32 multiply pass into the output buffer
+        scale = np.float32(target_peak / peak)
+        normalized_data = np.empty_like(self.data)
+        np.multiply(self.data, scale, out=normalized_data)
+        
+        normalized = AudioData(
             data=normalized_data,
             sample_rate=self.sample_rate,
             channels=self.channels
         )
+        
+        # Peak and energy scale linearly with the samples, so carry them over
+        # instead of making the caller pay another pass over the buffer
+        normalized._cache['peak'] = peak * float(scale)
+        if 'sum_sq' in self._cache:
+            normalized._cache['sum_sq'] = self._cache['sum_sq'] * float(scale) ** 2
+        return normalized
     
     def to_mono(self) -> 'AudioData':
         """Convert audio to mono if it's stereo."""
         if len(self.data.shape) == 2 and self.data.shape[1] > 1:
-            mono_data = np.mean(self.data, axis=1)
+            # Sum channel columns into one output buffer, then scale in place;
+            # much faster than a mean() reduction over the short channel axis
+            mono_data = np.add(self.data[:, 0], self.data[:, 1])
+            for channel in range(2, self.data.shape[1]):
+                np.add(mono_data, self.data[:, channel], out=mono_data)
+            mono_data *= np.float32(1.0 / self.data.shape[1])
             return AudioData(
                 data=mono_data,
                 sample_rate=self.sample_rate,
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptionText:
     """Value object representing transcribed text with additional metadata."""
     
@@ -67,6 +67,18 @@ class TranscriptionText:
             )
         return self
     
+    def remove_prefix_length(self, length: int) -> 'TranscriptionText':
+        """Return a new TranscriptionText with an already-matched prefix removed.
+        
+        Args:
+            length: Number of leading characters to drop
+        """
+        return TranscriptionText(
+            raw_text=self.raw_text,
+            cleaned_text=self.cleaned_text[length:].lstrip(),
+            language=self.language
+        )
+    
     def add_leading_space(self) -> 'TranscriptionText':
         """Return a new TranscriptionText with a leading space."""
         return TranscriptionText(
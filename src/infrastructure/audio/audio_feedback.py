@@ -1,5 +1,7 @@
+import queue
+import threading
 import winsound
-from typing import Optional
+from typing import Optional, Set, Tuple
 
 
 class AudioFeedback:
@@ -21,32 +23,78 @@ class AudioFeedback:
         
         # Default beep duration
         self.default_duration = 100
+        
+        # Beeps are played on a background thread since winsound.Beep blocks
+        self._beep_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending_beeps: Set[Tuple[int, int]] = set()
+        self._pending_lock = threading.Lock()
+        self._beep_thread = threading.Thread(target=self._beep_worker, daemon=True)
+        self._beep_thread.start()
+    
+    def _beep_worker(self) -> None:
+        """Play queued beeps one after another."""
+        while True:
+            beep = self._beep_queue.get()
+            with self._pending_lock:
+                self._pending_beeps.discard(beep)
+            self._beep_now(*beep)
+    
+    def _beep_now(self, frequency: int, duration: int) -> bool:
+        """Play a beep on the calling thread."""
+        try:
+            winsound.Beep(frequency, duration)
+            return True
+        except Exception as e:
+            print(f"Failed to play beep: {e}")
+            return False
     
     def play_beep(self, frequency: int, duration_ms: int = None) -> bool:
-        """Play a beep sound.
+        """Queue a beep sound without blocking the caller.
+        
+        A beep identical to one still waiting in the queue is coalesced.
         
         Args:
             frequency: Frequency of the beep in Hz
             duration_ms: Duration of the beep in milliseconds
             
         Returns:
-            True if beep was played, False if disabled or error
+            True if beep was queued, False if disabled
         """
         if not self.enabled:
             return False
         
         duration = duration_ms if duration_ms is not None else self.default_duration
+        beep = (frequency, duration)
         
-        try:
-            winsound.Beep(frequency, duration)
-            return True
-        except Exception as e:
-            print(f"Failed to play beep: {e}")
+        with self._pending_lock:
+            if beep not in self._pending_beeps:
+                self._pending_beeps.add(beep)
+                self._beep_queue.put_nowait(beep)
+        return True
+    
+    def play_beep_sync(self, frequency: int, duration_ms: int = None) -> bool:
+        """Play a beep sound, blocking until it finishes.
+        
+        Args:
+            frequency: Frequency of the beep in Hz
+            duration_ms: Duration of the beep in milliseconds
+            
+        Returns:
+            True if beep was played, False if disabled or error
+        """
+        if not self.enabled:
             return False
+        
+        duration = duration_ms if duration_ms is not None else self.default_duration
+        return self._beep_now(frequency, duration)
     
     def play_recording_start(self) -> bool:
-        """Play the recording start sound."""
-        return self.play_beep(self.start_frequency)
+        """Play the recording start sound.
+        
+        Blocks until the beep ends so it is not captured by a recording
+        started right after it.
+        """
+        return self.play_beep_sync(self.start_frequency)
     
     def play_recording_stop(self) -> bool:
         """Play the recording stop sound."""
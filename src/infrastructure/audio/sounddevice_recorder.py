@@ -1,8 +1,8 @@
-import queue
+import re
 import threading
-from typing import List, Tuple, Optional
+import time
+from typing import TYPE_CHECKING, List, Tuple, Optional
 import numpy as np
-import sounddevice as sd
 
 import sys
 import os
@@ -11,6 +11,14 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from src.domain.interfaces.audio_recorder import IAudioRecorder
 from src.domain.value_objects.audio_data import AudioData
 
+# sounddevice loads PortAudio on import, so it is imported on first use
+if TYPE_CHECKING:
+    import sounddevice as sd
+
+
+# System devices hidden from the input device list
+_FILTER_RE = re.compile(r'mapper|primary', re.IGNORECASE)
+
 
 class SoundDeviceRecorder(IAudioRecorder):
     """Sound device implementation of the audio recorder interface."""
@@ -19,7 +27,8 @@ class SoundDeviceRecorder(IAudioRecorder):
         self,
         sample_rate: int = 16000,
         channels: int = 1,
-        blocksize: int = 512
+        blocksize: int = 512,
+        buffer_seconds: int = 60
     ):
         """Initialize the sound device recorder.
         
@@ -27,31 +36,56 @@ class SoundDeviceRecorder(IAudioRecorder):
             sample_rate: Sample rate in Hz
             channels: Number of audio channels
             blocksize: Audio block size for streaming
+            buffer_seconds: Initial capacity of the capture buffer; it
+                doubles when a recording outgrows it
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.blocksize = blocksize
+        self.buffer_seconds = buffer_seconds
+        
+        # Contiguous capture buffer filled by the audio callback, and the
+        # number of frames written to it since recording start
+        self._buf = np.empty((0, channels), dtype=np.float32)
+        self._n = 0
         
-        self.audio_queue: queue.Queue = queue.Queue()
         self.recording = False
-        self.stream: Optional[sd.InputStream] = None
+        self.stream: Optional['sd.InputStream'] = None
         self.current_device_id: Optional[int] = None
         self.current_device_name: Optional[str] = None
         
+        # Cached result of sd.query_devices()
+        self._device_cache = None
+        self._device_cache_time = 0.0
+        
         # Thread safety
         self._lock = threading.Lock()
     
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback function for audio stream.
         
-        This is called from a separate thread by sounddevice.
+        This is called from a separate thread by sounddevice. It copies
+        the block into the capture buffer without locking.
         """
         if status:
             print(f"Audio stream status: {status}")
         
         if self.recording:
-            # Copy the data to avoid it being overwritten
-            self.audio_queue.put(indata.copy())
+            buf = self._buf
+            n = self._n
+            if n + frames > len(buf):
+                # Rare: recording outgrew the buffer, so double it
+                grown = np.empty(
+                    (max(2 * len(buf), n + frames), self.channels),
+                    dtype=np.float32
+                )
+                grown[:n] = buf[:n]
+                self._buf = buf = grown
+            
+            buf[n:n + frames] = indata
+            
+            # Publish the frames only once they are fully written
+            self._n = n + frames
     
     def start_recording(self, device_id: Optional[int] = None) -> None:
         """Start recording audio from the specified device."""
@@ -59,8 +93,12 @@ class SoundDeviceRecorder(IAudioRecorder):
             if self.recording:
                 raise RuntimeError("Already recording")
             
-            # Clear the queue
-            self.audio_queue = queue.Queue()
+            # Fresh buffer; the previous one may still back returned AudioData
+            self._buf = np.empty(
+                (self.buffer_seconds * self.sample_rate, self.channels),
+                dtype=np.float32
+            )
+            self._n = 0
             
             # Use provided device or current device
             device_to_use = device_id if device_id is not None else self.current_device_id
@@ -72,12 +110,15 @@ class SoundDeviceRecorder(IAudioRecorder):
                 self.stream = None
             
             # Create and start new stream
+            import sounddevice as sd
             self.stream = sd.InputStream(
                 callback=self._audio_callback,
                 device=device_to_use,
                 channels=self.channels,
                 samplerate=self.sample_rate,
-                blocksize=self.blocksize
+                blocksize=self.blocksize,
+                # Match the capture buffer so each block is a plain memcpy
+                dtype='float32'
             )
             
             self.stream.start()
@@ -95,24 +136,12 @@ class SoundDeviceRecorder(IAudioRecorder):
             if self.stream:
                 self.stream.stop()
             
-            # Collect all audio chunks from the queue
-            audio_chunks = []
-            while not self.audio_queue.empty():
-                try:
-                    chunk = self.audio_queue.get_nowait()
-                    audio_chunks.append(chunk)
-                except queue.Empty:
-                    break
+            # The recorded audio is a view of the buffer, no concatenation
+            audio_array = self._buf[:self._n]
             
-            # Concatenate audio chunks
-            if audio_chunks:
-                audio_array = np.concatenate(audio_chunks, axis=0)
-                # Flatten to 1D if mono
-                if self.channels == 1:
-                    audio_array = audio_array.flatten()
-            else:
-                # Return empty audio if no data recorded
-                audio_array = np.array([])
+            # Flatten to 1D if mono
+            if self.channels == 1:
+                audio_array = audio_array.reshape(-1)
             
             return AudioData(
                 data=audio_array,
@@ -124,28 +153,40 @@ class SoundDeviceRecorder(IAudioRecorder):
         """Check if currently recording."""
         return self.recording
     
+    def _devices(self):
+        """Get the device list, querying PortAudio at most every 2 seconds."""
+        now = time.monotonic()
+        if self._device_cache is None or now - self._device_cache_time >= 2.0:
+            import sounddevice as sd
+            self._device_cache = sd.query_devices()
+            self._device_cache_time = now
+        return self._device_cache
+    
+    def invalidate_device_cache(self) -> None:
+        """Force the next device lookup to re-query PortAudio (e.g. on hotplug)."""
+        self._device_cache = None
+    
     def get_available_devices(self) -> List[Tuple[int, str]]:
         """Get list of available audio input devices."""
-        devices = sd.query_devices()
+        devices = self._devices()
         input_devices = []
         seen_names = set()
         
         for idx, device in enumerate(devices):
             if device['max_input_channels'] > 0:
                 name = device['name']
-                # Filter out duplicates and system devices
-                if (name not in seen_names and 
-                    'mapper' not in name.lower() and 
-                    'primary' not in name.lower()):
+                key = name.casefold()
+                # Filter out duplicates (ignoring case) and system devices
+                if key not in seen_names and not _FILTER_RE.search(name):
                     input_devices.append((idx, name))
-                    seen_names.add(name)
+                    seen_names.add(key)
         
         return input_devices
     
     def set_device(self, device_id: int) -> None:
         """Set the audio input device to use."""
         # Validate device exists
-        devices = sd.query_devices()
+        devices = self._devices()
         if device_id >= len(devices):
             raise ValueError(f"Invalid device ID: {device_id}")
         
@@ -0,0 +1,123 @@
+"""Audio preparation and warmup shared by the transcriber adapters."""
+
+from typing import TYPE_CHECKING, Optional, Union
+import numpy as np
+
+if TYPE_CHECKING:
+    import torch
+
+from src.domain.interfaces.transcriber import ITranscriber
+from src.domain.value_objects.audio_data import AudioData
+
+# Whisper models, including faster-whisper's, expect 16 kHz mono input
+SAMPLE_RATE = 16000
+
+
+def prepare_audio(audio_data: AudioData, device: Optional[str] = None) -> 'Union[np.ndarray, torch.Tensor]':
+    """Convert audio to the contiguous float32 16 kHz samples the models take.
+    
+    Audio that has to be resampled is resampled on 'device' and, on an
+    accelerator, stays there and is normalized in place, so it is not
+    copied back to the host only to be uploaded again.
+    
+    Args:
+        audio_data: The audio data to prepare
+        device: Torch device to resample on, or None to resample with NumPy
+            so backends without torch never import it
+    
+    Returns:
+        Flat float32 samples at SAMPLE_RATE, scaled up if very quiet: a
+        tensor on 'device' if resampled on an accelerator, else an array
+    """
+    audio_array = audio_data.data
+    if len(audio_array.shape) > 1:
+        audio_array = audio_array.flatten()
+    audio_array = np.ascontiguousarray(audio_array, dtype=np.float32)
+    
+    # Resample once in memory if needed, on the model's device so CUDA
+    # setups use the GPU kernel
+    if audio_data.sample_rate != SAMPLE_RATE and device is None:
+        audio_array = _resample_fft(audio_array, audio_data.sample_rate)
+    elif audio_data.sample_rate != SAMPLE_RATE:
+        import torch
+        import torchaudio
+        resampled = torchaudio.functional.resample(
+            torch.from_numpy(audio_array).to(device),
+            audio_data.sample_rate,
+            SAMPLE_RATE,
+            resampling_method='sinc_interp_kaiser'
+        )
+        if resampled.device.type != 'cpu':
+            max_val = float(torch.maximum(-resampled.min(), resampled.max()))
+            if 0 < max_val < 0.1:
+                resampled.mul_(0.9 / max_val)
+            return resampled
+        audio_array = resampled.numpy()
+    
+    # Normalize audio if needed. The scale is a single multiply into a new
+    # buffer since audio_array may still be the AudioData's own samples.
+    max_val = float(max(-audio_array.min(), audio_array.max()))
+    if 0 < max_val < 0.1:
+        audio_array = np.multiply(audio_array, 0.9 / max_val, dtype=np.float32)
+    
+    return audio_array
+
+
+def _resample_fft(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Band-limited resampling to SAMPLE_RATE by truncating or padding the spectrum.
+    
+    Args:
+        samples: Flat float32 samples
+        sample_rate: Sample rate of 'samples'
+    
+    Returns:
+        Float32 samples at SAMPLE_RATE
+    """
+    num_out = round(len(samples) * SAMPLE_RATE / sample_rate)
+    if num_out == 0 or len(samples) == 0:
+        return np.zeros(num_out, dtype=np.float32)
+    
+    spectrum = np.fft.rfft(samples)
+    num_bins = num_out // 2 + 1
+    if num_bins <= len(spectrum):
+        spectrum = spectrum[:num_bins]
+    else:
+        spectrum = np.pad(spectrum, (0, num_bins - len(spectrum)))
+    
+    resampled = np.fft.irfft(spectrum, num_out)
+    return np.multiply(resampled, num_out / len(samples), dtype=np.float32)
+
+
+def run_warmup(transcriber: ITranscriber, full_window: bool = False) -> None:
+    """Perform a warmup transcription to initialize a loaded model.
+    
+    Args:
+        transcriber: Transcriber with a model already loaded
+        full_window: Decode a full 30 second window of noise instead of
+            one second of silence. Worth it on CUDA, where cudnn autotunes
+            on the first production-shaped tensors; on CPU it only adds
+            startup time.
+    """
+    print("Warming up model...")
+    
+    if full_window:
+        # Noise makes the decoder actually run (it short-circuits on
+        # silence). Its peak sits well above 0.1, so prepare_audio's
+        # quiet-audio normalization leaves it as is.
+        noise = np.random.default_rng(0).standard_normal(SAMPLE_RATE * 30, dtype=np.float32)
+        samples = noise * np.float32(0.05)
+    else:
+        samples = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    
+    dummy_audio = AudioData(
+        data=samples,
+        sample_rate=SAMPLE_RATE,
+        channels=1
+    )
+    
+    # Perform warmup transcription
+    try:
+        _ = transcriber.transcribe(dummy_audio, language='en')
+        print("Model warmup complete")
+    except Exception as e:
+        print(f"Warmup failed (non-critical): {e}")
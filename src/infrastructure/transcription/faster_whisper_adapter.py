@@ -0,0 +1,151 @@
+import math
+from typing import Optional, Dict, Any
+import sys
+import os
+
+import ctranslate2
+from faster_whisper import WhisperModel
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from src.domain.interfaces.transcriber import ITranscriber
+from src.domain.entities.transcription import Transcription
+from src.domain.value_objects.audio_data import AudioData
+from src.infrastructure.transcription._audio_input import prepare_audio, run_warmup
+
+
+class FasterWhisperAdapter(ITranscriber):
+    """faster-whisper (CTranslate2) implementation of the transcriber interface."""
+    
+    def __init__(self):
+        """Initialize the faster-whisper adapter."""
+        self.model: Optional[WhisperModel] = None
+        self.model_size: Optional[str] = None
+        self.device: Optional[str] = None
+        self.compute_type: Optional[str] = None
+        self.model_info: Dict[str, Any] = {}
+    
+    def transcribe(
+        self,
+        audio_data: AudioData,
+        language: str = 'en',
+        **kwargs
+    ) -> Transcription:
+        """Transcribe audio data to text using faster-whisper.
+        
+        Args:
+            audio_data: The audio data to transcribe
+            language: Language code for transcription
+            **kwargs: Additional faster-whisper transcription parameters
+        
+        Returns:
+            Transcription entity containing the transcribed text and metadata
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        audio_array = prepare_audio(audio_data)
+        
+        # Set default transcription parameters
+        transcribe_params = {
+            'language': language,
+            'beam_size': kwargs.get('beam_size', 5),
+            'best_of': kwargs.get('best_of', 5),
+            'temperature': kwargs.get('temperature', 0.0),
+        }
+        
+        # Override with any provided kwargs ('fp16' is fixed by compute_type)
+        transcribe_params.update(kwargs)
+        transcribe_params.pop('fp16', None)
+        
+        # Segments are decoded lazily as the generator is consumed
+        segments, _ = self.model.transcribe(audio_array, **transcribe_params)
+        
+        # Join text and average log probability in a single pass
+        parts = []
+        total_logprob = 0.0
+        for segment in segments:
+            parts.append(segment.text)
+            total_logprob += segment.avg_logprob
+        
+        text = ''.join(parts).strip()
+        
+        # Convert log probability to confidence (0-1 scale)
+        confidence = math.exp(total_logprob / len(parts)) if parts else None
+        
+        # Create transcription entity
+        return Transcription.create(
+            text=text,
+            duration_seconds=audio_data.duration_seconds,
+            model_size=self.model_size,
+            confidence=confidence,
+            audio_rms=audio_data.calculate_rms()
+        )
+    
+    def load_model(self, model_size: str, device: Optional[str] = None) -> None:
+        """Load the faster-whisper model.
+        
+        Args:
+            model_size: Size of the model to load (tiny, base, small, medium, large)
+            device: Device to load the model on (cpu, cuda, or None for auto-detect)
+        """
+        # Validate model size
+        valid_sizes = ['tiny', 'base', 'small', 'medium', 'large']
+        if model_size not in valid_sizes:
+            raise ValueError(f"Invalid model size: {model_size}. Must be one of {valid_sizes}")
+        
+        # Auto-detect device if not specified
+        if device is None:
+            device = 'cuda' if ctranslate2.get_cuda_device_count() > 0 else 'cpu'
+        
+        # INT8 kernels on CPU, FP16 on GPU
+        compute_type = 'int8' if device == 'cpu' else 'float16'
+        
+        # Load the model
+        print(f"Loading faster-whisper '{model_size}' model on {device} ({compute_type})...")
+        self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        
+        # Store model information
+        self.model_info = {
+            'size': model_size,
+            'device': device,
+            'backend': 'faster-whisper',
+            'compute_type': compute_type,
+            'gpu_available': ctranslate2.get_cuda_device_count() > 0,
+        }
+        
+        print(f"Model loaded on {device.upper()}")
+    
+    def unload_model(self) -> None:
+        """Unload the current model to free memory."""
+        if self.model is not None:
+            del self.model
+            self.model = None
+            self.model_size = None
+            self.device = None
+            self.compute_type = None
+            self.model_info = {}
+    
+    def is_model_loaded(self) -> bool:
+        """Check if a model is currently loaded."""
+        return self.model is not None
+    
+    def get_model_info(self) -> dict:
+        """Get information about the currently loaded model."""
+        if not self.is_model_loaded():
+            return {'loaded': False}
+        
+        return {
+            'loaded': True,
+            **self.model_info
+        }
+    
+    def warmup(self) -> None:
+        """Perform a warmup transcription to initialize the model."""
+        if not self.is_model_loaded():
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        run_warmup(self, full_window=self.device == 'cuda')
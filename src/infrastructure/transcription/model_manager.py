@@ -1,6 +1,20 @@
-from typing import Dict, Optional
-import torch
-import whisper
+import functools
+import os
+from typing import TYPE_CHECKING, Dict, Optional
+
+# torch and whisper are imported on first use to keep startup fast
+if TYPE_CHECKING:
+    import whisper
+
+
+def _physical_core_count() -> int:
+    """Get the number of physical CPU cores, falling back to logical cores."""
+    try:
+        import psutil
+        count = psutil.cpu_count(logical=False)
+    except ImportError:
+        count = None
+    return count or os.cpu_count() or 1
 
 
 class ModelManager:
@@ -8,6 +22,8 @@ class ModelManager:
     
     # Model sizes and their approximate memory requirements
     # VRAM usage includes model weights + inference overhead
+    # CPU RAM is for float32 weights; transcription.quantize_cpu stores the
+    # Linear weights as int8, so a quantized model needs less
     MODEL_SPECS = {
         'tiny': {'params': 39e6, 'vram_mb': 2000, 'cpu_ram_mb': 150},
         'base': {'params': 74e6, 'vram_mb': 3000, 'cpu_ram_mb': 290},
@@ -18,19 +34,33 @@ class ModelManager:
     
     def __init__(self):
         """Initialize the model manager."""
-        self.loaded_models: Dict[str, whisper.Whisper] = {}
-        self.device_info = self._get_device_info()
+        self.loaded_models: Dict[str, 'whisper.Whisper'] = {}
+    
+    @functools.cached_property
+    def device_info(self) -> dict:
+        """Get information about available compute devices.
+        
+        Detected on first access, since querying CUDA initializes its context.
+        """
+        return self._get_device_info()
     
     def _get_device_info(self) -> dict:
         """Get information about available compute devices."""
         info = {
-            'cuda_available': torch.cuda.is_available(),
+            'cuda_available': False,
             'cuda_device_count': 0,
             'cuda_devices': [],
             'recommended_device': 'cpu'
         }
         
-        if torch.cuda.is_available():
+        # Allow forcing CPU without touching CUDA at all
+        if os.environ.get('S2T_FORCE_CPU') == '1':
+            return info
+        
+        import torch
+        
+        info['cuda_available'] = torch.cuda.is_available()
+        if info['cuda_available']:
             info['cuda_device_count'] = torch.cuda.device_count()
             
             for i in range(torch.cuda.device_count()):
@@ -102,7 +132,7 @@ class ModelManager:
         
         return True, "Model can be loaded"
     
-    def optimize_model_for_device(self, model: whisper.Whisper, device: str) -> whisper.Whisper:
+    def optimize_model_for_device(self, model: 'whisper.Whisper', device: str) -> 'whisper.Whisper':
         """Apply device-specific optimizations to the model.
         
         Args:
@@ -112,6 +142,9 @@ class ModelManager:
         Returns:
             Optimized model
         """
+        import torch
+        import whisper
+        
         if device == 'cuda':
             # Enable mixed precision for faster inference
             model = model.half()
@@ -123,11 +156,45 @@ class ModelManager:
             # Ensure full precision on CPU
             model = model.float()
             
-            # Set number of threads for CPU inference
-            torch.set_num_threads(torch.get_num_threads())
+            # Quantize Linear weights to int8 to halve weight bandwidth.
+            # Whisper's Linear subclass only casts weights to the input dtype,
+            # a no-op in float32, and quantize_dynamic only swaps exact
+            # nn.Linear modules, so retype them first.
+            for module in model.modules():
+                if type(module) is whisper.model.Linear:
+                    module.__class__ = torch.nn.Linear
+            # Quantized in place so the float model is not deep-copied. The
+            # decoder's kv-cache forward hooks are installed per transcription
+            # on whatever modules sit at attn.key/attn.value, so they attach
+            # to the quantized replacements.
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
         
         return model
     
+    def configure_cpu_threads(self) -> int:
+        """Size torch's CPU thread pools for inference.
+        
+        Uses one thread per physical core; the default of one per logical
+        core oversubscribes the FP units on hyperthreaded CPUs. Call before
+        the first CPU inference so the inter-op pool can still be resized.
+        
+        Returns:
+            Number of intra-op threads configured
+        """
+        import torch
+        
+        num_cores = _physical_core_count()
+        torch.set_num_threads(num_cores)
+        try:
+            torch.set_num_interop_threads(max(1, num_cores // 2))
+        except RuntimeError:
+            # Can only be set before any inter-op parallel work has run
+            pass
+        
+        return num_cores
+    
     def estimate_transcription_speed(self, model_size: str, device: str, audio_duration: float) -> float:
         """Estimate transcription time for given audio duration.
         
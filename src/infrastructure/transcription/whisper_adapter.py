@@ -1,30 +1,51 @@
-import tempfile
+import math
 import uuid
-from pathlib import Path
-from typing import Optional, Dict, Any
-import numpy as np
-import soundfile as sf
-import torch
-import whisper
-
+from typing import TYPE_CHECKING, Optional, Dict, Any
 import sys
 import os
+import numpy as np
+
+# Let the CUDA caching allocator grow segments instead of fragmenting across
+# model reloads. Must be set before torch is first imported; the option is
+# not supported on Windows.
+if sys.platform != 'win32':
+    os.environ.setdefault('PYTORCH_CUDA_ALLOC_CONF', 'expandable_segments:True')
+
+# torch and whisper take seconds to import, so they are imported on first
+# use in the methods below rather than at application start
+if TYPE_CHECKING:
+    import torch
+    import whisper
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
 from src.domain.interfaces.transcriber import ITranscriber
 from src.domain.entities.transcription import Transcription
 from src.domain.value_objects.audio_data import AudioData
+from src.infrastructure.transcription.model_manager import ModelManager
+from src.infrastructure.transcription._audio_input import SAMPLE_RATE, prepare_audio, run_warmup
 
 
 class WhisperAdapter(ITranscriber):
     """Whisper implementation of the transcriber interface."""
     
-    def __init__(self):
-        """Initialize the Whisper adapter."""
-        self.model: Optional[whisper.Whisper] = None
+    def __init__(self, model_manager: Optional[ModelManager] = None, quantize_cpu: bool = False):
+        """Initialize the Whisper adapter.
+        
+        Args:
+            model_manager: Applies CPU thread sizing and quantization when
+                loading on CPU
+            quantize_cpu: Quantize Linear layers to int8 when loading on CPU
+        """
+        self.model_manager = model_manager
+        self.quantize_cpu = quantize_cpu
+        self.model: Optional['whisper.Whisper'] = None
         self.model_size: Optional[str] = None
         self.device: Optional[str] = None
         self.model_info: Dict[str, Any] = {}
+        
+        # Reusable page-locked staging buffer for host-to-GPU audio copies
+        self._pinned: Optional['torch.Tensor'] = None
     
     def transcribe(
         self,
@@ -45,66 +66,79 @@ class WhisperAdapter(ITranscriber):
         if self.model is None:
             raise RuntimeError("Model not loaded. Call load_model() first.")
         
-        # Prepare audio data
-        audio_array = audio_data.data
-        if len(audio_array.shape) > 1:
-            audio_array = audio_array.flatten()
-        
-        # Normalize audio if needed
-        max_val = np.max(np.abs(audio_array))
-        if max_val > 0 and max_val < 0.1:
-            audio_array = audio_array / max_val * 0.9
-        
-        # Save to temporary file (Whisper requires file input)
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            temp_path = Path(tmp_file.name)
-            sf.write(str(temp_path), audio_array, audio_data.sample_rate)
-        
-        try:
-            # Set default transcription parameters
-            transcribe_params = {
-                'language': language,
-                'fp16': self.device == 'cuda',
-                'beam_size': kwargs.get('beam_size', 5),
-                'best_of': kwargs.get('best_of', 5),
-                'temperature': kwargs.get('temperature', 0.0),
-            }
-            
-            # Override with any provided kwargs
-            transcribe_params.update(kwargs)
-            
-            # Perform transcription
-            result = self.model.transcribe(
-                str(temp_path.absolute()),
-                **transcribe_params
-            )
-            
-            # Extract text and metadata
-            text = result['text'].strip()
-            
-            # Calculate confidence from average log probability
-            confidence = None
-            if 'segments' in result and result['segments']:
-                avg_logprob = np.mean([
-                    segment.get('avg_logprob', 0)
-                    for segment in result['segments']
-                ])
-                # Convert log probability to confidence (0-1 scale)
-                confidence = float(np.exp(avg_logprob))
-            
-            # Create transcription entity
-            return Transcription.create(
-                text=text,
-                duration_seconds=audio_data.duration_seconds,
-                model_size=self.model_size,
-                confidence=confidence,
-                audio_rms=audio_data.calculate_rms()
-            )
+        import torch
+        
+        audio_array = prepare_audio(audio_data, self.device)
+        
+        # Audio resampled on the GPU is already there; only host arrays
+        # are staged through the pinned buffer
+        if isinstance(audio_array, np.ndarray):
+            audio_array = self._to_model_device(audio_array)
+        
+        # Set default transcription parameters
+        transcribe_params = {
+            'language': language,
+            'fp16': self.device == 'cuda',
+            'beam_size': kwargs.get('beam_size', 5),
+            'best_of': kwargs.get('best_of', 5),
+            'temperature': kwargs.get('temperature', 0.0),
+        }
+        
+        # Override with any provided kwargs
+        transcribe_params.update(kwargs)
+        
+        # Perform transcription without autograd bookkeeping
+        with torch.inference_mode():
+            result = self.model.transcribe(audio_array, **transcribe_params)
+        
+        # Extract text and metadata
+        text = result['text'].strip()
+        
+        # Calculate confidence from average log probability
+        total_logprob = 0.0
+        num_segments = 0
+        for segment in result.get('segments', ()):
+            total_logprob += segment.get('avg_logprob', 0.0)
+            num_segments += 1
+        
+        # Convert log probability to confidence (0-1 scale)
+        confidence = math.exp(total_logprob / num_segments) if num_segments else None
+        
+        # Create transcription entity
+        return Transcription.create(
+            text=text,
+            duration_seconds=audio_data.duration_seconds,
+            model_size=self.model_size,
+            confidence=confidence,
+            audio_rms=audio_data.calculate_rms()
+        )
+    
+    def _to_model_device(self, audio_array: np.ndarray):
+        """Move audio to the model's device ahead of the mel spectrogram.
+        
+        On CUDA the samples are staged through a pinned host buffer, grown
+        as needed and reused across calls, so the upload is a direct DMA
+        instead of going through the driver's pageable bounce buffer.
+        
+        Args:
+            audio_array: Contiguous float32 16 kHz samples
             
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                temp_path.unlink()
+        Returns:
+            A CUDA tensor, or the array unchanged on other devices
+        """
+        if self.device != 'cuda':
+            return audio_array
+        
+        import torch
+        
+        num_samples = audio_array.shape[0]
+        if self._pinned is None or self._pinned.numel() < num_samples:
+            capacity = max(num_samples, 30 * SAMPLE_RATE)
+            self._pinned = torch.empty(capacity, dtype=torch.float32).pin_memory()
+        
+        staging = self._pinned[:num_samples]
+        staging.copy_(torch.from_numpy(audio_array))
+        return staging.to(self.device, non_blocking=True)
     
     def load_model(self, model_size: str, device: Optional[str] = None) -> None:
         """Load the Whisper model.
@@ -118,18 +152,33 @@ class WhisperAdapter(ITranscriber):
         if model_size not in valid_sizes:
             raise ValueError(f"Invalid model size: {model_size}. Must be one of {valid_sizes}")
         
+        import torch
+        import whisper
+        
         # Auto-detect device if not specified
         if device is None:
             device = 'cuda' if torch.cuda.is_available() else 'cpu'
         
+        if device == 'cpu' and self.model_manager is not None:
+            self.model_manager.configure_cpu_threads()
+        
         # Load the model
         print(f"Loading Whisper '{model_size}' model on {device}...")
         self.model = whisper.load_model(model_size, device=device)
+        self.model.eval()
+        self.model.requires_grad_(False)
         self.model_size = model_size
         self.device = device
         
-        # Store model information
+        # Counted before quantization, whose packed weights are not parameters
         n_params = sum(p.numel() for p in self.model.parameters())
+        
+        # Quantize Linear layers to int8 for CPU inference if enabled
+        quantized = device == 'cpu' and self.quantize_cpu and self.model_manager is not None
+        if quantized:
+            self.model = self.model_manager.optimize_model_for_device(self.model, device)
+        
+        # Store model information
         self.model_info = {
             'size': model_size,
             'device': device,
@@ -141,24 +190,40 @@ class WhisperAdapter(ITranscriber):
         if device == 'cuda':
             self.model_info['gpu_name'] = torch.cuda.get_device_name(0)
             self.model_info['gpu_memory_allocated'] = torch.cuda.memory_allocated(0)
+        elif quantized:
+            self.model_info['quantization'] = 'int8'
         
         print(f"Model loaded: {n_params/1e6:.0f}M parameters on {device.upper()}")
     
-    def unload_model(self) -> None:
-        """Unload the current model to free memory."""
+    def unload_model(self, hard: bool = False) -> None:
+        """Unload the current model to free memory.
+        
+        Args:
+            hard: Also return cached CUDA memory to the driver. By default the
+                allocator keeps it so reloading a model avoids cudaMalloc.
+        """
         if self.model is not None:
+            # Drop every parameter and buffer reference so the tensors are
+            # freed by refcounting right here, without a full gc.collect()
+            # heap walk to find the model graph
+            for module in self.model.modules():
+                for name in module._parameters:
+                    module._parameters[name] = None
+                for name in module._buffers:
+                    module._buffers[name] = None
+            
             del self.model
             self.model = None
             self.model_size = None
             self.device = None
             self.model_info = {}
+            self._pinned = None
             
-            # Force garbage collection and clear CUDA cache if applicable
-            import gc
-            gc.collect()
-            
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+            # Clear CUDA cache if applicable
+            if hard:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
     
     def is_model_loaded(self) -> bool:
         """Check if a model is currently loaded."""
@@ -179,18 +244,4 @@ class WhisperAdapter(ITranscriber):
         if not self.is_model_loaded():
             raise RuntimeError("Model not loaded. Call load_model() first.")
         
-        print("Warming up model...")
-        
-        # Create dummy audio (1 second of silence)
-        dummy_audio = AudioData(
-            data=np.zeros(16000, dtype=np.float32),
-            sample_rate=16000,
-            channels=1
-        )
-        
-        # Perform warmup transcription
-        try:
-            _ = self.transcribe(dummy_audio, language='en')
-            print("Model warmup complete")
-        except Exception as e:
-            print(f"Warmup failed (non-critical): {e}")
\ No newline at end of file
+        run_warmup(self, full_window=self.device == 'cuda')
@@ -1,3 +1,4 @@
+import threading
 import time
 from typing import Optional, Callable
 import keyboard
@@ -9,6 +10,14 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from src.domain.interfaces.hotkey_handler import IHotkeyHandler
 
 
+class _DebounceState:
+    """Monotonic timestamp of a key's last accepted release."""
+    __slots__ = ('last',)
+    
+    def __init__(self):
+        self.last = float('-inf')
+
+
 class KeyboardSimulator(IHotkeyHandler):
     """Keyboard implementation of the hotkey handler interface."""
     
@@ -17,7 +26,6 @@ class KeyboardSimulator(IHotkeyHandler):
         self.registered_hotkeys = {}
         self.listening = False
         self.debounce_time = 0.5
-        self.last_release_times = {}
     
     def register_hotkey(
         self,
@@ -32,12 +40,18 @@ class KeyboardSimulator(IHotkeyHandler):
             on_press: Callback to execute when key is pressed
             on_release: Callback to execute when key is released
         """
+        # Set while the key is up; the press hook clears it
+        release_event = threading.Event()
+        release_event.set()
+        
         # Store handlers
         self.registered_hotkeys[key] = {
             'on_press': on_press,
             'on_release': on_release,
             'press_hook': None,
-            'release_hook': None
+            'release_hook': None,
+            'release_event': release_event,
+            'debounce': _DebounceState()
         }
         
         # Register keyboard hooks if listening
@@ -56,10 +70,6 @@ class KeyboardSimulator(IHotkeyHandler):
             
             # Remove from registry
             del self.registered_hotkeys[key]
-            
-            # Clean up last release time
-            if key in self.last_release_times:
-                del self.last_release_times[key]
     
     def start_listening(self) -> None:
         """Start listening for hotkey events."""
@@ -101,19 +111,22 @@ class KeyboardSimulator(IHotkeyHandler):
             return
         
         handlers = self.registered_hotkeys[key]
+        state = handlers['debounce']
+        now = time.monotonic
         
         # Create debounced handlers
         def on_press_handler(_):
+            handlers['release_event'].clear()
             if handlers['on_press']:
                 handlers['on_press']()
         
         def on_release_handler(_):
-            # Debounce release events
-            current_time = time.time()
-            last_release = self.last_release_times.get(key, 0)
+            handlers['release_event'].set()
             
-            if current_time - last_release >= self.debounce_time:
-                self.last_release_times[key] = current_time
+            # Debounce release events (monotonic, so immune to clock changes)
+            current_time = now()
+            if current_time - state.last >= self.debounce_time:
+                state.last = current_time
                 if handlers['on_release']:
                     handlers['on_release']()
         
@@ -176,6 +189,23 @@ class KeyboardSimulator(IHotkeyHandler):
     def wait_for_key_release(self, key: str, timeout: float = 5.0) -> bool:
         """Wait for a key to be released.
         
+        Args:
+            key: The key to wait for
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if key was released, False if timeout
+        """
+        # Wait on the hook-driven event when both hooks are installed
+        handlers = self.registered_hotkeys.get(key)
+        if handlers and handlers['press_hook'] and handlers['release_hook']:
+            return handlers['release_event'].wait(timeout)
+        
+        return self._poll_for_key_release(key, timeout)
+    
+    def _poll_for_key_release(self, key: str, timeout: float) -> bool:
+        """Poll the key state until it is released.
+        
         Args:
             key: The key to wait for
             timeout: Maximum time to wait in seconds
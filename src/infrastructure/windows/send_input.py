@@ -0,0 +1,92 @@
+import ctypes
+from ctypes import wintypes
+
+user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+# SendInput constants (winuser.h)
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_RETURN = 0x0D
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ('dx', wintypes.LONG),
+        ('dy', wintypes.LONG),
+        ('mouseData', wintypes.DWORD),
+        ('dwFlags', wintypes.DWORD),
+        ('time', wintypes.DWORD),
+        ('dwExtraInfo', ctypes.c_size_t)
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ('wVk', wintypes.WORD),
+        ('wScan', wintypes.WORD),
+        ('dwFlags', wintypes.DWORD),
+        ('time', wintypes.DWORD),
+        ('dwExtraInfo', ctypes.c_size_t)
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ('uMsg', wintypes.DWORD),
+        ('wParamL', wintypes.WORD),
+        ('wParamH', wintypes.WORD)
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # The mouse member sets the union's size, which SendInput checks
+    _fields_ = [
+        ('mi', MOUSEINPUT),
+        ('ki', KEYBDINPUT),
+        ('hi', HARDWAREINPUT)
+    ]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ('u',)
+    _fields_ = [
+        ('type', wintypes.DWORD),
+        ('u', _INPUTUNION)
+    ]
+
+
+user32.SendInput.restype = wintypes.UINT
+user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+
+
+def send_unicode_text(text: str) -> int:
+    """Type text into the focused window with a single SendInput call.
+    
+    Each UTF-16 code unit becomes a KEYEVENTF_UNICODE down/up pair, so any
+    character can be typed regardless of keyboard layout. Newlines are sent
+    as the Enter key.
+    
+    Args:
+        text: The text to type
+    
+    Returns:
+        Number of input events inserted, 0 if input was blocked
+    """
+    data = text.encode('utf-16-le')
+    units = memoryview(data).cast('H')
+    
+    inputs = (INPUT * (2 * len(units)))()
+    for i, unit in enumerate(units):
+        down = inputs[2 * i]
+        up = inputs[2 * i + 1]
+        down.type = up.type = INPUT_KEYBOARD
+        if unit == 0x0A:  # '\n'
+            down.ki.wVk = up.ki.wVk = VK_RETURN
+            up.ki.dwFlags = KEYEVENTF_KEYUP
+        else:
+            down.ki.wScan = up.ki.wScan = unit
+            down.ki.dwFlags = KEYEVENTF_UNICODE
+            up.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+    
+    return user32.SendInput(len(inputs), inputs, ctypes.sizeof(INPUT))
@@ -0,0 +1,99 @@
+import ctypes
+import threading
+from ctypes import wintypes
+from typing import Callable, List, Tuple
+
+user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+# WinEvent constants (winuser.h)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+WM_QUIT = 0x0012
+
+WinEventProc = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,  # hWinEventHook
+    wintypes.DWORD,   # event
+    wintypes.HWND,    # hwnd
+    wintypes.LONG,    # idObject
+    wintypes.LONG,    # idChild
+    wintypes.DWORD,   # idEventThread
+    wintypes.DWORD    # dwmsEventTime
+)
+
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.SetWinEventHook.argtypes = [
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+]
+user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+
+
+class WinEventHookThread:
+    """Background thread that delivers WinEvents to a Python callback.
+    
+    Out-of-context WinEvent hooks are called on the thread that installed
+    them, and only while that thread pumps messages, so the hooks are set
+    up and serviced on a dedicated daemon thread.
+    """
+    
+    def __init__(
+        self,
+        event_ranges: List[Tuple[int, int]],
+        callback: Callable[[int, int], None]
+    ):
+        """Start the hook thread.
+        
+        Args:
+            event_ranges: (event_min, event_max) pairs to subscribe to
+            callback: Called as callback(event, hwnd) on the hook thread;
+                it should return quickly
+        """
+        self._event_ranges = event_ranges
+        self._callback = callback
+        self._thread_id = None
+        self._ready = threading.Event()
+        self.active = False
+        
+        # Keep a reference so the C callback is not garbage collected
+        self._proc = WinEventProc(self._on_event)
+        
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(1.0)
+    
+    def _on_event(self, hook, event, hwnd, id_object, id_child, thread_id, time_ms):
+        """Forward a WinEvent to the callback."""
+        try:
+            self._callback(event, hwnd or 0)
+        except Exception as e:
+            print(f"Error in WinEvent callback: {e}")
+    
+    def _run(self) -> None:
+        """Install the hooks and pump messages until stopped."""
+        self._thread_id = threading.get_native_id()
+        hooks = []
+        for event_min, event_max in self._event_ranges:
+            hook = user32.SetWinEventHook(
+                event_min, event_max, None, self._proc, 0, 0, WINEVENT_OUTOFCONTEXT
+            )
+            if hook:
+                hooks.append(hook)
+        
+        self.active = len(hooks) == len(self._event_ranges)
+        self._ready.set()
+        
+        try:
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            self.active = False
+            for hook in hooks:
+                user32.UnhookWinEvent(hook)
+    
+    def stop(self) -> None:
+        """Remove the hooks and end the thread."""
+        if self._thread_id is not None:
+            user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
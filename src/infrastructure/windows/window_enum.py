@@ -0,0 +1,45 @@
+import ctypes
+from ctypes import wintypes
+from typing import List, Tuple
+
+user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+user32.EnumWindows.restype = wintypes.BOOL
+user32.IsWindowVisible.argtypes = [wintypes.HWND]
+user32.IsWindowVisible.restype = wintypes.BOOL
+user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+user32.GetWindowTextW.restype = ctypes.c_int
+
+# Longest window title read, in UTF-16 code units
+_TITLE_BUFFER_SIZE = 1024
+
+
+def enum_visible_windows() -> List[Tuple[int, str]]:
+    """Get the handle and title of every visible, titled top-level window.
+    
+    The EnumWindows callback only records each handle; visibility and title
+    lookups then run in one loop over the collected handles with a reused
+    text buffer.
+    
+    Returns:
+        List of (handle, title) tuples in Z order
+    """
+    handles = []
+    append = handles.append
+    
+    def collect(hwnd, _):
+        append(hwnd)
+        return True
+    
+    user32.EnumWindows(WNDENUMPROC(collect), 0)
+    
+    windows = []
+    buffer = ctypes.create_unicode_buffer(_TITLE_BUFFER_SIZE)
+    for hwnd in handles:
+        if user32.IsWindowVisible(hwnd) and user32.GetWindowTextW(hwnd, buffer, _TITLE_BUFFER_SIZE):
+            windows.append((hwnd, buffer.value))
+    
+    return windows
@@ -1,7 +1,12 @@
+import ctypes
+import operator
+import threading
 import time
 from typing import List, Optional
+import win32api
 import win32gui
 import win32con
+import win32process
 import keyboard
 
 import sys
@@ -10,6 +15,25 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from src.domain.interfaces.text_output import ITextOutput
 from src.domain.value_objects.window_target import WindowTarget
+from src.infrastructure.windows.win_event_hook import WinEventHookThread, EVENT_SYSTEM_FOREGROUND
+from src.infrastructure.windows.send_input import send_unicode_text
+from src.infrastructure.windows.window_enum import enum_visible_windows
+
+
+# How long the enumerated window list is reused, in seconds
+_WINDOWS_CACHE_TTL = 1.0
+
+# Virtual-key codes of the modifiers that must be released before typing
+# (the generic codes cover both left and right keys)
+VK_SHIFT = 0x10
+VK_CONTROL = 0x11
+VK_MENU = 0x12
+
+# The three codes are adjacent, so their key-down bits can be tested with one
+# little-endian 32-bit read starting at VK_SHIFT
+_MODIFIER_DOWN_MASK = 0x00808080  # Bit 7 of VK_SHIFT, VK_CONTROL and VK_MENU
+
+_user32 = ctypes.WinDLL('user32')
 
 
 class WindowManager(ITextOutput):
@@ -20,6 +44,28 @@ class WindowManager(ITextOutput):
         self.type_delay = 0.0  # Delay between keystrokes
         self.focus_delay = 0.1  # Delay after focusing window
         self.execute_delay = 0.1  # Delay before pressing Enter
+        
+        # Keyboard state buffer for reading held modifiers, plus a 32-bit
+        # view of the bytes from VK_SHIFT onwards
+        self._kbd_state = (ctypes.c_ubyte * 256)()
+        self._kbd_modifiers = ctypes.c_uint32.from_buffer(self._kbd_state, VK_SHIFT)
+        
+        # Window list cache and the monotonic time it was built
+        self._windows_cache: Optional[List[WindowTarget]] = None
+        self._windows_cache_time = 0.0
+        
+        # Set by the foreground hook once the window being focused is active
+        self._fg_event = threading.Event()
+        self._fg_target = 0
+        
+        try:
+            self._win_events = WinEventHookThread(
+                [(EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND)],
+                self._on_win_event
+            )
+        except Exception as e:
+            print(f"Could not hook window events, falling back to polling: {e}")
+            self._win_events = None
     
     def send_text(
         self,
@@ -38,22 +84,22 @@ class WindowManager(ITextOutput):
             True if successful, False otherwise
         """
         try:
-            # Save current window if we need to restore it
+            # Save current window if we need to restore it; this one query
+            # also tells _focus_window whether the target already has focus
             original_window = None
             if not target.is_current_focus:
                 original_window = win32gui.GetForegroundWindow()
-            
-            # Focus target window if specified
-            if not target.is_current_focus:
-                if not self.focus_window(target):
+                if not self._focus_window(target, original_window):
                     return False
             
             # Wait for any modifier keys to be released
             self._wait_for_modifiers_release()
             
             # Type the text (with leading space by default)
-            text_to_type = ' ' + text if text and not text.startswith(' ') else text
-            keyboard.write(text_to_type, delay=self.type_delay)
+            if text:
+                text_to_type = text if text[0] == ' ' else ' ' + text
+                if self.type_delay > 0 or not send_unicode_text(text_to_type):
+                    keyboard.write(text_to_type, delay=self.type_delay)
             
             # Execute if requested
             if execute:
@@ -64,7 +110,7 @@ class WindowManager(ITextOutput):
                     current = win32gui.GetForegroundWindow()
                     if current != target.handle:
                         # Try to refocus
-                        self.focus_window(target)
+                        self._focus_window(target, current)
                         time.sleep(0.05)
                 
                 # Move cursor to end and press Enter
@@ -73,7 +119,7 @@ class WindowManager(ITextOutput):
                 keyboard.press_and_release('enter')
             
             # Restore original window if we changed focus
-            if original_window and not target.is_current_focus:
+            if original_window and original_window != target.handle:
                 try:
                     win32gui.SetForegroundWindow(original_window)
                 except:
@@ -91,36 +137,40 @@ class WindowManager(ITextOutput):
         Returns:
             List of WindowTarget objects
         """
-        windows = []
+        # Serve the cached list if it was built within the TTL
+        now = time.monotonic()
+        if self._windows_cache is not None and now - self._windows_cache_time < _WINDOWS_CACHE_TTL:
+            return list(self._windows_cache)
         
-        def enum_callback(hwnd, _):
-            if win32gui.IsWindowVisible(hwnd):
-                title = win32gui.GetWindowText(hwnd)
-                if title and title.strip():
-                    try:
-                        # Get process name if possible
-                        process_name = None
-                        # Note: Getting process name requires additional Win32 API calls
-                        # For simplicity, we'll skip it for now
-                        
-                        windows.append(WindowTarget.create_specific_window(
-                            handle=hwnd,
-                            title=title,
-                            process_name=process_name
-                        ))
-                    except ValueError:
-                        pass  # Skip invalid windows
-            return True
+        keyed_windows = []
         
-        win32gui.EnumWindows(enum_callback, None)
+        for hwnd, title in enum_visible_windows():
+            if title.strip():
+                try:
+                    # Get process name if possible
+                    process_name = None
+                    # Note: Getting process name requires additional Win32 API calls
+                    # For simplicity, we'll skip it for now
+                    
+                    # Lowercase once here for the sort key
+                    keyed_windows.append((title.lower(), WindowTarget.create_specific_window(
+                        handle=hwnd,
+                        title=title,
+                        process_name=process_name
+                    )))
+                except ValueError:
+                    pass  # Skip invalid windows
         
         # Sort by title
-        windows.sort(key=lambda w: w.title.lower())
+        keyed_windows.sort(key=operator.itemgetter(0))
         
         # Add current focus option at the beginning
-        windows.insert(0, WindowTarget.create_current_focus())
+        windows = [WindowTarget.create_current_focus()]
+        windows.extend(window for _, window in keyed_windows)
         
-        return windows
+        self._windows_cache = windows
+        self._windows_cache_time = now
+        return list(windows)
     
     def get_current_window(self) -> WindowTarget:
         """Get the currently focused window.
@@ -148,22 +198,54 @@ class WindowManager(ITextOutput):
         Args:
             target: The window to focus
             
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._focus_window(target)
+    
+    def _focus_window(self, target: WindowTarget, current_fg: Optional[int] = None) -> bool:
+        """Focus the specified window, given the foreground window if known.
+        
+        Args:
+            target: The window to focus
+            current_fg: Handle of the foreground window if the caller has
+                already queried it, so an already-focused target is a no-op
+            
         Returns:
             True if successful, False otherwise
         """
         if target.is_current_focus:
             return True  # Already using current focus
         
+        if current_fg is not None and current_fg == target.handle:
+            return True  # Target already has focus
+        
         try:
             # Check if window still exists
             if not self.is_window_valid(target):
                 return False
             
-            # Attempt to bring window to foreground
-            win32gui.SetForegroundWindow(target.handle)
-            time.sleep(self.focus_delay)
+            # Attempt to bring window to foreground. Sharing input state with
+            # the foreground thread lifts the foreground lock, so the switch
+            # normally completes before SetForegroundWindow returns.
+            self._fg_target = target.handle
+            self._fg_event.clear()
+            if current_fg is None:
+                current_fg = win32gui.GetForegroundWindow()
+            self._set_foreground_attached(target.handle, current_fg)
             
             # Verify focus change
+            current = win32gui.GetForegroundWindow()
+            if current == target.handle:
+                return True
+            
+            # Not switched yet; wait for the foreground hook, bounded by the
+            # focus delay, then check again
+            if self._win_events is not None and self._win_events.active:
+                self._fg_event.wait(self.focus_delay)
+            else:
+                time.sleep(self.focus_delay)
+            
             current = win32gui.GetForegroundWindow()
             return current == target.handle
             
@@ -171,6 +253,31 @@ class WindowManager(ITextOutput):
             print(f"Error focusing window: {e}")
             return False
     
+    def _set_foreground_attached(self, hwnd: int, current_fg: int) -> None:
+        """Call SetForegroundWindow with input attached to the foreground thread.
+        
+        Args:
+            hwnd: Handle of the window to bring to the foreground
+            current_fg: Handle of the current foreground window, or 0
+        """
+        our_tid = win32api.GetCurrentThreadId()
+        fg_tid = win32process.GetWindowThreadProcessId(current_fg)[0] if current_fg else 0
+        
+        attached = False
+        if fg_tid and fg_tid != our_tid:
+            try:
+                win32process.AttachThreadInput(our_tid, fg_tid, True)
+                attached = True
+            except Exception:
+                pass  # Fall back to a plain SetForegroundWindow
+        
+        try:
+            win32gui.BringWindowToTop(hwnd)
+            win32gui.SetForegroundWindow(hwnd)
+        finally:
+            if attached:
+                win32process.AttachThreadInput(our_tid, fg_tid, False)
+    
     def is_window_valid(self, target: WindowTarget) -> bool:
         """Check if a window target is still valid (exists).
         
@@ -184,31 +291,57 @@ class WindowManager(ITextOutput):
             return True  # Current focus is always valid
         
         try:
-            return win32gui.IsWindow(target.handle)
+            return bool(win32gui.IsWindow(target.handle))
         except:
             return False
     
+    def _on_win_event(self, event: int, hwnd: int) -> None:
+        """Handle a WinEvent from the hook thread.
+        
+        Foreground changes release a pending focus wait.
+        
+        Args:
+            event: The WinEvent constant
+            hwnd: Handle of the window that generated the event
+        """
+        if event == EVENT_SYSTEM_FOREGROUND and hwnd == self._fg_target:
+            self._fg_event.set()
+    
+    def _modifiers_held(self) -> bool:
+        """Read whether any modifier key is physically held.
+        
+        Returns:
+            True if shift, ctrl or alt is down
+        """
+        # GetKeyState syncs this thread's key state with the physical
+        # keyboard, then one GetKeyboardState call reads every key
+        _user32.GetKeyState(0)
+        _user32.GetKeyboardState(self._kbd_state)
+        return bool(self._kbd_modifiers.value & _MODIFIER_DOWN_MASK)
+    
     def _wait_for_modifiers_release(self, timeout: float = 0.5) -> None:
         """Wait for modifier keys to be released.
         
         Args:
             timeout: Maximum time to wait in seconds
         """
-        start_time = time.time()
-        modifiers = ['shift', 'ctrl', 'alt', 'cmd']
-        
-        while time.time() - start_time < timeout:
-            all_released = True
-            for mod in modifiers:
-                if keyboard.is_pressed(mod):
-                    all_released = False
-                    break
-            
-            if all_released:
-                break
-            
+        deadline = time.perf_counter() + timeout
+        
+        while self._modifiers_held() and time.perf_counter() < deadline:
             time.sleep(0.01)
     
+    def close(self) -> None:
+        """Remove the WinEvent hook and stop its thread."""
+        # getattr: __del__ may run on an instance whose __init__ failed
+        win_events = getattr(self, '_win_events', None)
+        if win_events is not None:
+            win_events.stop()
+            self._win_events = None
+    
+    def __del__(self):
+        """Cleanup on destruction."""
+        self.close()
+    
     def set_delays(
         self,
         type_delay: Optional[float] = None,
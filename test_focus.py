@@ -2,6 +2,7 @@
 """
 Quick test script to debug window focus and execution issues.
 """
+import queue
 import time
 import keyboard
 import win32gui
@@ -124,13 +125,20 @@ if __name__ == "__main__":
     print("This will test different methods for window focus and key execution")
     print("\nPress 'f' to start focus tests, 'm' for message tests, 'q' to quit")
     
+    # Hotkey callbacks run on keyboard's listener thread, and the tests
+    # themselves call keyboard.wait(), so hand each test to the main thread.
+    # The hotkeys are removed while a test runs so its own key presses and
+    # typed text do not queue more tests.
+    actions = queue.Queue()
+    hotkeys = {'f': test_focus_and_execution, 'm': test_window_messages, 'q': None}
+    
     while True:
-        key = keyboard.read_event()
-        if key.event_type == keyboard.KEY_DOWN:
-            if key.name == 'f':
-                test_focus_and_execution()
-            elif key.name == 'm':
-                test_window_messages()
-            elif key.name == 'q':
-                print("Exiting...")
-                break
\ No newline at end of file
+        for key, action in hotkeys.items():
+            keyboard.add_hotkey(key, actions.put, args=(action,))
+        action = actions.get()
+        keyboard.unhook_all_hotkeys()
+        
+        if action is None:
+            print("Exiting...")
+            break
+        action()
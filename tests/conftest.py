@@ -0,0 +1,10 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+
+# Make the 'src' package importable from every test module, and put 'src'
+# itself on the path as main.py does for the domain interfaces' imports
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(_ROOT, 'src'))
+sys.path.insert(0, _ROOT)
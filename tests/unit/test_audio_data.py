@@ -2,9 +2,6 @@
 
 import pytest
 import numpy as np
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from src.domain.value_objects.audio_data import AudioData
 
@@ -22,6 +19,23 @@ class TestAudioData:
         assert audio.num_samples == 16000
         assert audio.duration_seconds == 1.0
     
+    def test_data_stored_as_float32(self):
+        """Test that sample data is converted to float32."""
+        data = np.random.rand(1000)
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+        
+        assert audio.data.dtype == np.float32
+        assert audio.to_mono().data.dtype == np.float32
+        assert audio.normalize().data.dtype == np.float32
+    
+    def test_data_stored_contiguous(self):
+        """Test that strided input is stored as a contiguous buffer."""
+        data = np.random.rand(2, 1000).astype(np.float32).T
+        audio = AudioData(data=data, sample_rate=16000, channels=2)
+        
+        assert audio.data.flags.c_contiguous
+        np.testing.assert_array_equal(audio.data, data)
+    
     def test_invalid_sample_rate(self):
         """Test that invalid sample rate raises error."""
         data = np.random.rand(16000)
@@ -48,6 +62,14 @@ class TestAudioData:
         rms = audio.calculate_rms()
         assert abs(rms - 0.5) < 0.001
     
+    def test_calculate_rms_multichannel(self):
+        """Test RMS covers every sample of multi-channel audio."""
+        data = np.random.rand(1000, 2) - 0.5
+        audio = AudioData(data=data, sample_rate=16000, channels=2)
+        
+        expected = np.sqrt(np.mean(data.astype(np.float32) ** 2))
+        assert abs(audio.calculate_rms() - expected) < 1e-6
+    
     def test_calculate_rms_empty(self):
         """Test RMS calculation with empty data."""
         data = np.array([])
@@ -63,6 +85,21 @@ class TestAudioData:
         peak = audio.calculate_peak_amplitude()
         assert abs(peak - 0.9) < 0.001
     
+    def test_rms_and_peak_are_cached(self):
+        """Test that RMS and peak are computed once per instance."""
+        data = np.array([-0.5, 0.3, 0.8, -0.9, 0.1])
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+        
+        assert 'sum_sq' not in audio._cache and 'peak' not in audio._cache
+        
+        rms = audio.calculate_rms()
+        peak = audio.calculate_peak_amplitude()
+        
+        assert audio._cache['sum_sq'] == pytest.approx(rms ** 2 * 5)
+        assert audio._cache['peak'] == peak
+        assert audio.calculate_rms() == rms
+        assert audio.calculate_peak_amplitude() == peak
+    
     def test_is_silent(self):
         """Test silence detection."""
         # Very quiet audio
@@ -129,6 +166,16 @@ class TestAudioData:
         assert len(mono_audio.data.shape) == 1
         assert mono_audio.data.shape[0] == 1000
     
+    def test_to_mono_averages_channels(self):
+        """Test that mono samples are the mean of all channels."""
+        data = np.random.rand(1000, 3).astype(np.float32)
+        audio = AudioData(data=data, sample_rate=16000, channels=3)
+        
+        mono_audio = audio.to_mono()
+        
+        assert mono_audio.data.dtype == np.float32
+        np.testing.assert_allclose(mono_audio.data, data.mean(axis=1), rtol=1e-6)
+    
     def test_to_mono_already_mono(self):
         """Test converting mono to mono (should return same)."""
         mono_data = np.random.rand(1000)
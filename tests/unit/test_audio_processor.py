@@ -0,0 +1,141 @@
+"""Unit tests for AudioProcessor domain service."""
+
+import pytest
+import numpy as np
+
+from src.domain.services.audio_processor import AudioProcessor
+from src.domain.value_objects.audio_data import AudioData
+
+
+class TestAudioProcessor:
+    """Test suite for AudioProcessor."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.processor = AudioProcessor()
+
+    def test_noise_gate_silences_quiet_windows(self):
+        """Test that windows below the threshold are gated to zero."""
+        data = np.full(16000, 0.0005, dtype=np.float32)
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+
+        gated = self.processor.apply_noise_gate(
+            audio, threshold=0.001, release_time=0.005
+        )
+
+        # Each 160-sample window fades over 80 samples, then is zeroed
+        windows = gated.data[:15840].reshape(-1, 160)
+        expected_fade = np.broadcast_to(0.0005 * np.linspace(1.0, 0.0, 80), (99, 80))
+        np.testing.assert_allclose(windows[:, :80], expected_fade, rtol=1e-6, atol=1e-12)
+        assert np.all(windows[:, 80:] == 0)
+        # The trailing window is not processed
+        np.testing.assert_array_equal(gated.data[15840:], data[15840:])
+
+    def test_noise_gate_keeps_loud_windows(self):
+        """Test that windows above the threshold are left untouched."""
+        data = np.full(16000, 0.5, dtype=np.float32)
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+
+        gated = self.processor.apply_noise_gate(audio, threshold=0.001)
+
+        np.testing.assert_array_equal(gated.data, data)
+
+    def test_noise_gate_mixed_signal(self):
+        """Test gating only affects the quiet section of the signal."""
+        data = np.concatenate([
+            np.full(8000, 0.5, dtype=np.float32),
+            np.full(8000, 0.0001, dtype=np.float32)
+        ])
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+
+        gated = self.processor.apply_noise_gate(
+            audio, threshold=0.001, release_time=0.005
+        )
+
+        np.testing.assert_array_equal(gated.data[:8000], data[:8000])
+        assert np.all(gated.data[8000:15840].reshape(-1, 160)[:, 80:] == 0)
+
+    def test_noise_gate_stereo(self):
+        """Test that multi-channel audio is gated across all channels."""
+        data = np.concatenate([
+            np.full((8000, 2), 0.5, dtype=np.float32),
+            np.full((8000, 2), 0.0001, dtype=np.float32)
+        ])
+        audio = AudioData(data=data, sample_rate=16000, channels=2)
+
+        gated = self.processor.apply_noise_gate(
+            audio, threshold=0.001, release_time=0.005
+        )
+
+        assert gated.data.shape == data.shape
+        np.testing.assert_array_equal(gated.data[:8000], data[:8000])
+        windows = gated.data[8000:15840].reshape(-1, 160, 2)
+        expected_fade = np.broadcast_to(
+            0.0001 * np.linspace(1.0, 0.0, 80)[:, None], (49, 80, 2)
+        )
+        np.testing.assert_allclose(windows[:, :80], expected_fade, rtol=1e-6, atol=1e-12)
+        assert np.all(windows[:, 80:] == 0)
+
+    def test_noise_gate_does_not_modify_input(self):
+        """Test that the original audio data is not mutated."""
+        data = np.full(16000, 0.0005, dtype=np.float32)
+        audio = AudioData(data=data.copy(), sample_rate=16000, channels=1)
+
+        self.processor.apply_noise_gate(audio, threshold=0.001)
+
+        np.testing.assert_array_equal(audio.data, data)
+
+    def test_trim_silence_removes_leading_and_trailing_silence(self):
+        """Test that silence is trimmed from both ends."""
+        data = np.zeros(48000, dtype=np.float32)
+        data[16000:32000] = 0.5
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+
+        trimmed = self.processor.trim_silence(audio, threshold=0.001)
+
+        assert trimmed.num_samples < audio.num_samples
+        assert np.all(trimmed.data[800:-800] == 0.5)
+        assert 16000 <= trimmed.num_samples <= 16000 + 2 * 1600
+
+    def test_trim_silence_stereo(self):
+        """Test that multi-channel audio is trimmed on its sample axis."""
+        data = np.zeros((48000, 2), dtype=np.float32)
+        data[16000:32000, 1] = 0.5
+        audio = AudioData(data=data, sample_rate=16000, channels=2)
+
+        trimmed = self.processor.trim_silence(audio, threshold=0.001)
+
+        assert trimmed.data.shape[1] == 2
+        assert np.all(trimmed.data[800:-800, 1] == 0.5)
+        assert 16000 <= trimmed.num_samples <= 16000 + 2 * 1600
+
+    def test_trim_silence_all_silent_returns_original(self):
+        """Test that fully silent audio is returned unchanged."""
+        data = np.zeros(16000, dtype=np.float32)
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+
+        trimmed = self.processor.trim_silence(audio, threshold=0.001)
+
+        assert trimmed.num_samples == audio.num_samples
+
+    def test_zero_crossing_rate(self):
+        """Test zero crossing rate on an alternating signal."""
+        data = np.array([0.5, -0.5, 0.5, -0.5, 0.5, 0.5, 0.5, 0.5], dtype=np.float32)
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+
+        features = self.processor.calculate_audio_features(audio)
+
+        assert features['zero_crossing_rate'] == 4 / 8
+
+    def test_noise_gate_inplace_reuses_buffer(self):
+        """Test that the in-place gate writes into the input buffer."""
+        data = np.full(16000, 0.0005, dtype=np.float32)
+        audio = AudioData(data=data, sample_rate=16000, channels=1)
+        audio.calculate_rms()
+
+        gated = self.processor.apply_noise_gate(audio, threshold=0.001, inplace=True)
+
+        assert gated.data is data
+        assert gated is not audio
+        # The input's cached stats are dropped along with its old samples
+        assert audio.calculate_rms() == gated.calculate_rms()
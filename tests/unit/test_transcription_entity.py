@@ -2,9 +2,6 @@
 
 import pytest
 from datetime import datetime
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from src.domain.entities.transcription import Transcription
 
@@ -1,9 +1,6 @@
 """Unit tests for VoiceCommandParser domain service."""
 
 import pytest
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from src.domain.services.voice_command_parser import VoiceCommandParser
 from src.domain.entities.voice_command import CommandType
@@ -91,6 +88,20 @@ class TestVoiceCommandParser:
         assert command.execute == False
         assert command.target_window == "Visual Studio Code"
     
+    def test_parse_prefers_longest_prefix(self):
+        """Test that a longer prefix wins over a shorter one it contains."""
+        command = self.parser.parse("configure audio input")
+        
+        assert command.command_type == CommandType.CONFIG
+        assert command.text == "audio input"
+    
+    def test_parse_prefix_requires_word_boundary(self):
+        """Test that a prefix embedded in a longer word is not a command."""
+        command = self.parser.parse("executed the plan")
+        
+        assert command.command_type == CommandType.TEXT
+        assert command.text == "executed the plan"
+    
     def test_parse_multiple_commands(self):
         """Test parsing multiple commands in batch."""
         texts = [